@@ -2,6 +2,7 @@
 """
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from src.pdf_ingest import extract_sections
 from src.summarizer import make_slide_text, extractive_summary
 from src.visual_selector import compose_visual
@@ -24,17 +25,20 @@ def run(input_pdf, outdir, slides=8):
     slide_items = [make_slide_text(s) for s in selected]
     visuals_dir = os.path.join(outdir, 'visuals')
     os.makedirs(visuals_dir, exist_ok=True)
-    visual_paths = []
-    for i, s in enumerate(slide_items, start=1):
-        out = os.path.join(visuals_dir, f'slide_{i:02d}.png')
-        compose_visual(s['headline'], s.get('bullets', []), out)
-        visual_paths.append(out)
+    visual_paths = render_slide_images(slide_items, visuals_dir)
     pptx_path = os.path.join(outdir, 'slides.pptx')
-    build_pptx(slide_items, visual_paths, pptx_path)
-    # tts
     tts_outdir = os.path.join(outdir, 'tts')
     texts = [s.get('note') or s.get('headline') for s in slide_items]
-    audio_files = synthesize_texts(texts, tts_outdir)
+    # visuals and pptx render on worker threads while TTS runs here: the
+    # pyttsx3 engine is not thread-safe, so it keeps the calling thread to itself
+    with ThreadPoolExecutor() as ex:
+        visual_jobs = [ex.submit(compose_visual, s['headline'], s.get('bullets', []), out)
+                       for s, out in zip(slide_items, visual_paths)]
+        pptx_job = ex.submit(build_pptx, slide_items, visual_paths, pptx_path)
+        audio_files = synthesize_texts(texts, tts_outdir)
+        for job in visual_jobs:
+            job.result()
+        pptx_job.result()
     # make video
     video_path = os.path.join(outdir, 'video.mp4')
     make_video(visual_paths, audio_files, music_file=None, out_path=video_path)
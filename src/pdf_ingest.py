@@ -1,41 +1,52 @@
-"""PDF ingestion: extract sections using pdfplumber with simple heuristics.
+"""PDF ingestion: extract sections using PyMuPDF with simple heuristics.
 Produces a list of sections: {title, text, page}
 """
-import pdfplumber
+import fitz
 import re
 
+_NUMBERED_RE = re.compile(r'^\d+\.?\s+')
+
+
 def is_heading_line(line: str) -> bool:
     if not line: return False
     # heuristics: short line, Title Case or ALL CAPS, numeric prefix
     words = line.strip()
-    if len(words.split()) <= 6:
-        if re.match(r'^\d+\.?\s+', words):
+    parts = words.split()
+    if len(parts) <= 6:
+        if _NUMBERED_RE.match(words):
             return True
         # ALL CAPS
-        if words.upper() == words and sum(c.isalpha() for c in words) > 0:
+        if words.isupper():
             return True
         # Title case heuristic (most words capitalized)
-        caps = sum(1 for w in words.split() if w[:1].isupper())
-        if caps >= max(1, len(words.split()) // 2):
+        caps = sum(1 for w in parts if w[0].isupper())
+        if caps >= max(1, len(parts) // 2):
             return True
     return False
 
 
+def _flush(current, sections):
+    """Join the buffered lines of `current` into its text and keep it if non-empty."""
+    lines = current.pop("lines")
+    if lines:
+        current["text"] = " ".join(lines)
+        sections.append(current)
+
+
 def extract_sections(pdf_path: str):
     sections = []
-    with pdfplumber.open(pdf_path) as pdf:
-        current = {"title": "Introduction", "text": "", "page": 0}
-        for i, page in enumerate(pdf.pages, start=1):
-            text = page.extract_text() or ""
+    with fitz.open(pdf_path) as doc:
+        # buffer lines per section and join once; repeated += is quadratic on long sections
+        current = {"title": "Introduction", "lines": [], "page": 0}
+        for i, page in enumerate(doc, start=1):
+            text = page.get_text("text") or ""
             lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
             for line in lines:
                 if is_heading_line(line):
                     # start new section
-                    if current["text"].strip():
-                        sections.append(current)
-                    current = {"title": line.strip(), "text": "", "page": i}
+                    _flush(current, sections)
+                    current = {"title": line.strip(), "lines": [], "page": i}
                 else:
-                    current["text"] += " " + line
-        if current["text"].strip():
-            sections.append(current)
+                    current["lines"].append(line)
+        _flush(current, sections)
     return sections
@@ -2,54 +2,86 @@
 If transformers are available, user can replace make_summary with a model call.
 """
 from typing import Dict
+from collections import Counter
+from functools import lru_cache
 from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-import heapq
 import nltk
+import numpy as np
+import re
 
-nltk.download('punkt')
-nltk.download('punkt_tab')
-nltk.download('stopwords')
+try:
+    nltk.data.find('corpora/stopwords')
+except LookupError:
+    nltk.download('stopwords', quiet=True)
 
-def extractive_summary(text, max_sentences=5):
+# sentence boundary: terminal punctuation followed by a capitalised word, or a blank line
+_SENT_RE = re.compile(r"(?<=[.!?])\s+(?=[A-Z])|\n{2,}")
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+_STOPWORDS = frozenset(stopwords.words('english'))
+
+@lru_cache(maxsize=256)
+def _score_sentences(text):
+    """Return (sentences, scores) for `text` in document order.
+
+    Sentences sharing no frequent word with the text score zero and are dropped.
+    """
     # 1. Tokenize into sentences and words
-    sentences = sent_tokenize(text)
-    words = word_tokenize(text.lower())
+    sentences = [s.strip() for s in _SENT_RE.split(text) if s.strip()]
+    words = _WORD_RE.findall(text.lower())
 
     # 2. Filter out stop words
-    stop_words = set(stopwords.words('english'))
-    filtered_words = [word for word in words if word.isalnum() and word not in stop_words]
+    filtered_words = [word for word in words if word.isalnum() and word not in _STOPWORDS]
 
     # 3. Calculate word frequencies
-    word_frequencies = {}
-    for word in filtered_words:
-        if word not in word_frequencies:
-            word_frequencies[word] = 0
-        word_frequencies[word] += 1
-
-    # 4. Score sentences
-    sentence_scores = {}
-    for sentence in sentences:
-        for word in word_tokenize(sentence.lower()):
-            if word in word_frequencies:
-                if sentence not in sentence_scores:
-                    sentence_scores[sentence] = 0
-                sentence_scores[sentence] += word_frequencies[word]
-
-    # 5. Select top sentences
-    summary_sentences = heapq.nlargest(max_sentences, sentence_scores, key=sentence_scores.get)
-
-    # 6. Construct the summary
-    summary = ' '.join(summary_sentences)
-    return summary
+    word_frequencies = Counter(filtered_words)
+    vocab = {word: idx for idx, word in enumerate(word_frequencies)}
+    freqs = np.fromiter(word_frequencies.values(), dtype=np.int64, count=len(vocab))
+
+    # 4. Score sentences: flatten every sentence's word ids into one array and
+    #    sum their frequencies per sentence with a single bincount
+    sentence_counts = Counter(sentences)
+    unique = list(sentence_counts)
+    tokens = [_WORD_RE.findall(sentence.lower()) for sentence in unique]
+    lengths = np.fromiter(map(len, tokens), dtype=np.intp, count=len(unique))
+    ids = np.fromiter((vocab.get(w, -1) for toks in tokens for w in toks),
+                      dtype=np.intp, count=int(lengths.sum()))
+    owner = np.repeat(np.arange(len(unique)), lengths)
+    known = ids >= 0
+    scores = np.bincount(owner[known], weights=freqs[ids[known]], minlength=len(unique))
+    # repeated sentences accumulate their score, as the dict tally did
+    scores *= np.fromiter(sentence_counts.values(), dtype=np.int64, count=len(unique))
+
+    keep = scores > 0
+    scores = scores[keep].astype(np.int64)
+    scores.setflags(write=False)  # shared through the lru_cache
+    return tuple(s for s, kept in zip(unique, keep) if kept), scores
+
+
+def top_k(scored, k):
+    """Join the `k` best sentences from `_score_sentences` output, best first."""
+    sentences, scores = scored
+    n = len(sentences)
+    k = min(k, n)
+    if k <= 0:
+        return ''
+    # 5. Select top sentences: a unique rank (score, then earlier position) keeps
+    #    the heapq.nlargest tie order while argpartition picks the top k in O(n)
+    rank = scores * n + np.arange(n - 1, -1, -1)
+    top = np.argpartition(-rank, k - 1)[:k]
+    top = top[np.argsort(-rank[top])]
+    return ' '.join(sentences[i] for i in top)
+
+
+def extractive_summary(text, max_sentences=5):
+    return top_k(_score_sentences(text), max_sentences)
 
 def make_slide_text(section: Dict) -> Dict:
     """Return: {headline, bullets (list), note}"""
     text = section.get("text", "")
-    headline = section.get("title") or extractive_summary(text, max_sentences=1)
-    summary = extractive_summary(text, max_sentences=2)
+    scored = _score_sentences(text)
+    headline = section.get("title") or top_k(scored, 1)
+    summary = top_k(scored, 2)
     # derive bullets by splitting summary into short phrases/sentences
     bullets = [s.strip() for s in summary.split('.') if s.strip()][:2]
-    note = extractive_summary(text, max_sentences=1)
+    note = top_k(scored, 1)
     return {"headline": headline.strip(), "bullets": bullets, "note": note.strip()}
-
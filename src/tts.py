@@ -1,22 +1,89 @@
 """Simple offline TTS using pyttsx3. Produces WAV files per slide.
+
+Synthesized audio is cached on disk keyed by (text, voice, rate), so
+unchanged slide notes are copied instead of re-synthesized.
 """
 import pyttsx3
+from functools import lru_cache
+import hashlib
 import os
+import shutil
+import tempfile
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'pdf-summarize', 'tts')
+
+# last values pushed to the shared engine, so unchanged properties are not re-set
+_engine_props = {}
+
+
+@lru_cache(maxsize=1)
+def _get_engine():
+    """Initialise the pyttsx3 engine once per process; driver loading is slow."""
+    return pyttsx3.init()
+
+
+def _set_property(engine, name: str, value):
+    if _engine_props.get(name) != value:
+        engine.setProperty(name, value)
+        _engine_props[name] = value
+
 
+def _cache_path(text: str, voice_id, voice_rate: int) -> str:
+    key = hashlib.sha256(f"{text}|{voice_id or ''}|{voice_rate}".encode('utf-8')).hexdigest()
+    return os.path.join(CACHE_DIR, f'{key}.mp3')
 
-def synthesize_texts(texts, out_dir: str, voice_rate: int = 150):
+
+def synthesize_texts(texts, out_dir: str, voice_rate: int = 150, voice_id=None):
+    """Write one audio file per text into out_dir and return their paths.
+
+    voice_id: pyttsx3 voice id; defaults to the first installed voice.
+    """
     os.makedirs(out_dir, exist_ok=True)
-    engine = pyttsx3.init()
-    engine.setProperty('rate', voice_rate)
-    # choose voice if available
-    voices = engine.getProperty('voices')
-    if voices:
-        engine.setProperty('voice', voices[0].id)
+    os.makedirs(CACHE_DIR, exist_ok=True)
 
     out_files = []
+    misses = []
     for i, t in enumerate(texts, start=1):
         out_path = os.path.join(out_dir, f'slide_{i:02d}.mp3')
-        engine.save_to_file(t or '', out_path)
+        cached = _cache_path(t or '', voice_id, voice_rate)
+        if os.path.exists(cached):
+            shutil.copyfile(cached, out_path)
+        else:
+            misses.append((t or '', out_path, cached))
         out_files.append(out_path)
+    if not misses:
+        return out_files
+
+    engine = _get_engine()
+    _set_property(engine, 'rate', voice_rate)
+    # choose voice if available
+    if voice_id is None:
+        voices = engine.getProperty('voices')
+        if voices:
+            _set_property(engine, 'voice', voices[0].id)
+    else:
+        _set_property(engine, 'voice', voice_id)
+
+    for t, out_path, _ in misses:
+        # remove stale audio from earlier runs: pyttsx3 can fail without raising,
+        # and a leftover slide_NN file must not be cached under the new text
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        engine.save_to_file(t, out_path)
     engine.runAndWait()
-    return out_files
\ No newline at end of file
+    for _, out_path, cached in misses:
+        if os.path.exists(out_path) and os.path.getsize(out_path) > 0:
+            _store_in_cache(out_path, cached)
+    return out_files
+
+
+def _store_in_cache(src: str, cached: str):
+    """Copy src to cached atomically so an interrupted run never leaves a partial hit."""
+    fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as dst, open(src, 'rb') as f:
+            shutil.copyfileobj(f, dst)
+        os.replace(tmp, cached)
+    except BaseException:
+        os.remove(tmp)
+        raise
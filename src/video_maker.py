@@ -1,34 +1,59 @@
-"""Combine slide images and audio into a final MP4 using moviepy.
+"""Combine slide images and audio into a final MP4 by driving FFmpeg directly.
+
+Each slide is encoded to its own short segment (in parallel), then the
+segments are joined with FFmpeg's concat demuxer without re-encoding.
 """
-from moviepy import ImageClip, AudioFileClip, concatenate_videoclips, CompositeAudioClip
+from concurrent.futures import ThreadPoolExecutor
+import imageio_ffmpeg
 import os
+import subprocess
+import tempfile
+
+FPS = 24
+
+
+def _ffmpeg(*args):
+    cmd = [imageio_ffmpeg.get_ffmpeg_exe(), '-y', '-loglevel', 'error', *args]
+    subprocess.run(cmd, check=True)
+
+
+def _encode_segment(img, audio, out_path, per_slide_duration):
+    """Encode one still image plus its narration into an MP4 segment."""
+    if os.path.exists(audio):
+        # slide lasts as long as its audio
+        audio_args = ['-i', audio, '-shortest']
+    else:
+        audio_args = ['-f', 'lavfi', '-i', 'anullsrc=channel_layout=stereo:sample_rate=44100',
+                      '-t', str(per_slide_duration)]
+    # identical codec settings for every segment so the concat step can stream-copy
+    _ffmpeg('-loop', '1', '-framerate', str(FPS), '-i', img, *audio_args,
+            '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2',
+            '-c:v', 'libx264', '-tune', 'stillimage', '-pix_fmt', 'yuv420p', '-r', str(FPS),
+            '-c:a', 'aac', '-ar', '44100', '-ac', '2', out_path)
+    return out_path
 
 
 def make_video(slide_images, audio_files, music_file, out_path: str, per_slide_duration=6):
     assert len(slide_images) == len(audio_files)
-    clips = []
-    for img, audio in zip(slide_images, audio_files):
-        # if audio exists, use its duration; else use default
-        if os.path.exists(audio):
-            a = AudioFileClip(audio)
-            duration = a.duration
-        else:
-            a = None
-            duration = per_slide_duration
-        # moviepy version in this environment uses `with_duration` and
-        # attaching audio by setting the `audio` attribute.
-        clip = ImageClip(img).with_duration(duration)
-        if a:
-            clip.audio = a
-        clips.append(clip)
-    final = concatenate_videoclips(clips, method='compose')
-    # add background music if provided
-    if music_file and os.path.exists(music_file):
-        bg = AudioFileClip(music_file)
-        bg = bg.audio_loop(duration=final.duration).volumex(0.08)
-        # mix
-        final_audio = CompositeAudioClip([final.audio, bg]) if final.audio else bg
-        final = final.set_audio(final_audio)
     os.makedirs(os.path.dirname(out_path) or '.', exist_ok=True)
-    final.write_videofile(out_path, fps=24, codec='libx264', audio_codec='aac')
-    return out_path
\ No newline at end of file
+    with tempfile.TemporaryDirectory() as tmp:
+        segments = [os.path.join(tmp, f'segment_{i:03d}.mp4') for i in range(len(slide_images))]
+        # ffmpeg runs out of process, so threads are enough to encode segments concurrently
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(ex.map(_encode_segment, slide_images, audio_files, segments,
+                        [per_slide_duration] * len(segments)))
+        concat_list = os.path.join(tmp, 'ffconcat.txt')
+        with open(concat_list, 'w', encoding='utf-8') as f:
+            for seg in segments:
+                escaped = seg.replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        concat_args = ['-f', 'concat', '-safe', '0', '-i', concat_list]
+        # add background music if provided
+        if music_file and os.path.exists(music_file):
+            _ffmpeg(*concat_args, '-stream_loop', '-1', '-i', music_file,
+                    '-filter_complex',
+                    '[1:a]volume=0.08[bg];[0:a][bg]amix=inputs=2:duration=first:normalize=0[a]',
+                    '-map', '0:v', '-map', '[a]', '-c:v', 'copy', '-c:a', 'aac', out_path)
+        else:
+            _ffmpeg(*concat_args, '-c', 'copy', out_path)
+    return out_path
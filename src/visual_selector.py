@@ -8,6 +8,7 @@ Functions provided:
 - create_visuals_for_slides(...) : generate one visual per slide item and return paths
 """
 from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
 import os
 from typing import List, Dict
 import hashlib
@@ -20,8 +21,12 @@ def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 
+@lru_cache(maxsize=32)
 def _safe_load_font(size: int):
-    """Try to load a truetype font if available, otherwise fall back to default."""
+    """Try to load a truetype font if available, otherwise fall back to default.
+
+    Cached so each process opens a given font size only once.
+    """
     try:
         if FONT_PATH:
             return ImageFont.truetype(FONT_PATH, size)
@@ -36,16 +41,34 @@ def _safe_load_font(size: int):
     return ImageFont.load_default()
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify(text: str) -> str:
-    s = text.lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = s.strip("-")
+    s = _SLUG_RE.sub("-", text.lower()).strip("-")
     if not s:
         s = hashlib.sha1(text.encode("utf-8")).hexdigest()[:8]
     return s
 
 
+# (text, font) -> (w, h); fonts hash by identity, and holding them as keys keeps
+# them alive, so an entry can never be matched by a different font
+_TEXT_SIZE_CACHE = {}
+_TEXT_SIZE_CACHE_MAX = 4096
+
+
 def _text_size(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont):
+    """Return (width, height) of rendered text, memoized per (text, font)."""
+    key = (text, font)
+    size = _TEXT_SIZE_CACHE.get(key)
+    if size is None:
+        if len(_TEXT_SIZE_CACHE) >= _TEXT_SIZE_CACHE_MAX:
+            _TEXT_SIZE_CACHE.clear()
+        size = _TEXT_SIZE_CACHE[key] = _measure_text(draw, text, font)
+    return size
+
+
+def _measure_text(draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont):
     """Return (width, height) of rendered text using the best available API.
 
     Tries: draw.textbbox -> font.getbbox/getsize -> draw.textsize
@@ -80,11 +103,14 @@ def compose_visual(headline: str, bullets: List[str], out_path: str, size=(1280,
 
     headline: main headline text
     bullets: list of bullet strings
-    out_path: output file path (directories will be created)
+    out_path: output file path (directories will be created), or a writable
+        binary file object such as BytesIO to render in memory
     size: (w, h) in pixels
     bg_color: background color tuple
     """
-    ensure_dir(os.path.dirname(out_path) or '.')
+    is_path = isinstance(out_path, (str, os.PathLike))
+    if is_path:
+        ensure_dir(os.path.dirname(out_path) or '.')
     img = Image.new('RGB', size, bg_color)
     draw = ImageDraw.Draw(img)
 
@@ -119,8 +145,12 @@ def compose_visual(headline: str, bullets: List[str], out_path: str, size=(1280,
     headline_font = _safe_load_font(int(h * 0.08))
     body_font = _safe_load_font(int(h * 0.038))
 
+    # characters per line from the average glyph width, computed once per font
+    head_chars = max(10, int(right_w / (max(1, _text_size(draw, "a", headline_font)[0]) + 1)))
+    body_chars = max(10, int(right_w / (max(1, _text_size(draw, "a", body_font)[0]) + 1)))
+
     # draw headline with wrapping
-    head_lines = _wrap_text(headline, max_chars=max(10, int(right_w / (max(1, _text_size(draw, "a", headline_font)[0]) + 1))))
+    head_lines = _wrap_text(headline, max_chars=head_chars)
     y = padding
     first = True
     for line in head_lines.split('\n'):
@@ -131,14 +161,23 @@ def compose_visual(headline: str, bullets: List[str], out_path: str, size=(1280,
     # bullets with slightly larger spacing and softer color
     y += int(h * 0.03)
     for b in bullets:
-        lines = _wrap_text(b, max_chars=max(10, int(right_w / (max(1, _text_size(draw, "a", body_font)[0]) + 1)))).split('\n')
+        lines = _wrap_text(b, max_chars=body_chars).split('\n')
         for ln in lines:
             draw.text((right_x + 10, y), '• ' + ln, fill=(60, 70, 85), font=body_font)
             y += int(_text_size(draw, ln, body_font)[1] * 1.3)
 
     # footer small credit
 
-    img.save(out_path)
+    # paths keep extension-based format detection; file objects have no extension
+    if is_path:
+        ext = os.path.splitext(os.fspath(out_path))[1].lower()
+        fmt = Image.registered_extensions().get(ext)
+    else:
+        fmt = 'PNG'
+    if fmt == 'PNG':
+        # flat-colour card: a small palette keeps the PNG tiny and cheap to decode downstream
+        img = img.quantize(colors=64, method=Image.Quantize.FASTOCTREE)
+    img.save(out_path, format=None if is_path else fmt, optimize=True)
     return out_path
 
 
@@ -166,28 +205,35 @@ def _wrap_text(text: str, max_chars: int = 40) -> str:
     return '\n'.join(lines)
 
 
-def create_visuals_for_slides(slide_items: List[Dict], out_dir: str, size=(1280, 720)) -> List[str]:
+def create_visuals_for_slides(slide_items: List[Dict], out_dir: str, size=(1280, 720), executor=None) -> List[str]:
     """Create one visual per slide item and return list of output paths.
 
     slide_items: list of dicts containing at least 'headline' and optional 'bullets'
     out_dir: directory to write images into
     size: tuple for image size (defaults to 1280x720 for 16:9)
+    executor: optional concurrent.futures executor to render slides on; by default
+        slides render serially, which beats worker startup for a typical deck
     """
     ensure_dir(out_dir)
-    paths = []
+    jobs = []
     for i, item in enumerate(slide_items):
         headline = item.get('headline', f'Slide {i+1}')
         bullets = item.get('bullets', []) or []
         # deterministic filename: index + slug of headline
         slug = _slugify(headline)[:40]
         filename = f"{i+1:02d}-{slug}.png"
-        out_path = os.path.join(out_dir, filename)
-        try:
-            compose_visual(headline, bullets, out_path, size=size)
-            paths.append(out_path)
-        except Exception:
-            # fallback: create a very simple blank image so downstream doesn't fail
-            fallback = Image.new('RGB', size, (240, 240, 240))
-            fallback.save(out_path)
-            paths.append(out_path)
-    return paths
+        jobs.append((headline, bullets, os.path.join(out_dir, filename), size))
+    mapper = executor.map if executor is not None else map
+    return list(mapper(_compose_one, jobs))
+
+
+def _compose_one(job) -> str:
+    """Render one (headline, bullets, out_path, size) job; module-level so it pickles."""
+    headline, bullets, out_path, size = job
+    try:
+        return compose_visual(headline, bullets, out_path, size=size)
+    except Exception:
+        # fallback: create a very simple blank image so downstream doesn't fail
+        fallback = Image.new('RGB', size, (240, 240, 240))
+        fallback.save(out_path)
+        return out_path